@@ -6,23 +6,22 @@ import numpy as np
 # Set Seaborn style
 sns.set(style="whitegrid")
 
-# Read CSV file
-df = pd.read_csv('test_results.csv')
-
-# Ensure 'min flush keys' and 'max chunk size' columns are numeric
-df['min flush keys'] = pd.to_numeric(df['min flush keys'])
-df['max chunk size'] = pd.to_numeric(df['max chunk size'])
+# Read CSV file, parsing the numeric columns directly
+df = pd.read_csv(
+    'test_results.csv',
+    dtype={'min flush keys': 'int64', 'max chunk size': 'int64', 'latency': 'float64', 'flush wait': 'float64'},
+)
 
 # Process data
 df['label'] = df['min flush keys'].astype(str) + '-' + df['max chunk size'].astype(str) + '-bulk:' + df['bulk'].astype(str)
 # Sort data
 df = df.sort_values(by=['min flush keys', 'max chunk size', 'bulk'])
 
-# Create pivot table
-pivot_df = df.pivot_table(index=['SQL', 'label'], values=['latency', 'flush wait'], aggfunc='mean').reset_index()
+# Create pivot table: one row per SQL type, one column per (metric, label)
+pivot_df = df.groupby(['SQL', 'label'])[['latency', 'flush wait']].mean().unstack('label')
 
 # Get all SQL types and labels
-sql_types = pivot_df['SQL'].unique()
+sql_types = pivot_df.index
 labels = list(df['label'].unique())  # Keep labels order consistent with sorted data
 x = np.arange(len(sql_types))  # Positions on the x-axis
 width = 0.35  # Width of each group of bars
@@ -34,18 +33,21 @@ colors = sns.color_palette("Set2", len(labels))
 # Plotting
 fig, ax = plt.subplots(figsize=(14, 8))
 
-# Plot each label's bars
+# Plot each label's bars, collecting the flush wait overlay so it is drawn in one call
+flush_x, flush_height, flush_colors = [], [], []
 for i, (label, color) in enumerate(zip(labels, colors)):
-    sql_label_data = pivot_df[pivot_df['label'] == label]
-    latency = sql_label_data['latency']
-    flush_wait = sql_label_data['flush wait']
-    
+    latency = pivot_df['latency'][label]
+    bar_x = x + (i - len(labels) / 2) * bar_width
+
     # Plot overall latency bars
-    bars = ax.bar(x + (i - len(labels) / 2) * bar_width, latency, bar_width, label=f'{label} latency', color=color)
-    
-    # Plot flush wait bars with transparent background and black grid lines
-    for j, (bar, fw) in enumerate(zip(bars, flush_wait)):
-        ax.bar(bar.get_x() + bar.get_width() / 2, fw, bar.get_width(), bottom=bar.get_y(), color=color, edgecolor='black', alpha=0.5, hatch='//', label='flush wait' if i == 0 and j == 0 else "")
+    ax.bar(bar_x, latency, bar_width, label=f'{label} latency', color=color)
+
+    flush_x.append(bar_x)
+    flush_height.append(pivot_df['flush wait'][label].to_numpy())
+    flush_colors += [color] * len(bar_x)
+
+# Plot flush wait bars with transparent background and black grid lines
+ax.bar(np.concatenate(flush_x), np.concatenate(flush_height), bar_width, color=flush_colors, edgecolor='black', alpha=0.5, hatch='//', label='flush wait')
 
 # Set x-axis labels and title
 ax.set_xlabel('SQL')
@@ -60,10 +60,10 @@ def execute_statement_with_hint_option(
     time.sleep(interval)
     print(datetime.now(tzlocal.get_localzone()))
     print(statement)
-    start_time = time.time()
+    start_time = time.monotonic()
     with connection.cursor() as cursor:
         cursor.execute(statement)
-    exec_time = time.time() - start_time
+    exec_time = time.monotonic() - start_time
     flush_wait_time, dump_time = get_flush_metrics(connection)
     return exec_time, flush_wait_time, dump_time
 
@@ -189,64 +189,6 @@ def main(
 
     init_target_table(connection, table_initialization_statements)
 
-    test_results = []
-
-    for test in tests:
-        for (
-            min_flush_keys,
-            min_flush_mem_size,
-            force_flush_threshold,
-            max_chunk_size,
-        ) in configs:
-            for bulk in use_bulk:
-                print()
-                print(
-                    (
-                        f"Running test: {test['alias']}, "
-                        f"min_flush_keys={min_flush_keys}, "
-                        f"min_flush_mem_size={min_flush_mem_size}, "
-                        f"force_flush_threshold={force_flush_threshold}, "
-                        f"max_chunk_size={max_chunk_size}, "
-                        f"use_bulk={bulk}"
-                    )
-                )
-                execute_init_statements(
-                    connection,
-                    test["init"],
-                    workload,
-                    limit,
-                    min_flush_keys,
-                    min_flush_mem_size,
-                    force_flush_threshold,
-                    max_chunk_size,
-                )
-                latency, flush_wait, dump_time = execute_statement_with_hint_option(
-                    connection,
-                    test["statement"],
-                    workload,
-                    limit,
-                    use_hint=bulk,
-                    interval=interval,
-                )
-                print(
-                    f"Execution time: {latency:.2f} seconds; "
-                    f"Flush wait: {flush_wait:.2f} seconds; "
-                    f"Dump time: {dump_time:.2f} seconds"
-                )
-                row = [
-                    test["alias"],
-                    min_flush_keys,
-                    min_flush_mem_size,
-                    force_flush_threshold,
-                    max_chunk_size,
-                    bulk,
-                    workload.target_table,
-                    f"{latency:.2f}",
-                    f"{flush_wait:.2f}",
-                    f"{dump_time:.2f}"
-                ]
-                test_results.append(row)
-
     with open("test_results.csv", "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
         header = [
@@ -262,8 +204,64 @@ def main(
             "dump time"
         ]
         writer.writerow(header)
-        for result in test_results:
-            writer.writerow(result)
+
+        for test in tests:
+            for (
+                min_flush_keys,
+                min_flush_mem_size,
+                force_flush_threshold,
+                max_chunk_size,
+            ) in configs:
+                for bulk in use_bulk:
+                    print()
+                    print(
+                        (
+                            f"Running test: {test['alias']}, "
+                            f"min_flush_keys={min_flush_keys}, "
+                            f"min_flush_mem_size={min_flush_mem_size}, "
+                            f"force_flush_threshold={force_flush_threshold}, "
+                            f"max_chunk_size={max_chunk_size}, "
+                            f"use_bulk={bulk}"
+                        )
+                    )
+                    execute_init_statements(
+                        connection,
+                        test["init"],
+                        workload,
+                        limit,
+                        min_flush_keys,
+                        min_flush_mem_size,
+                        force_flush_threshold,
+                        max_chunk_size,
+                    )
+                    latency, flush_wait, dump_time = execute_statement_with_hint_option(
+                        connection,
+                        test["statement"],
+                        workload,
+                        limit,
+                        use_hint=bulk,
+                        interval=interval,
+                    )
+                    print(
+                        f"Execution time: {latency:.2f} seconds; "
+                        f"Flush wait: {flush_wait:.2f} seconds; "
+                        f"Dump time: {dump_time:.2f} seconds"
+                    )
+                    row = [
+                        test["alias"],
+                        min_flush_keys,
+                        min_flush_mem_size,
+                        force_flush_threshold,
+                        max_chunk_size,
+                        bulk,
+                        workload.target_table,
+                        f"{latency:.2f}",
+                        f"{flush_wait:.2f}",
+                        f"{dump_time:.2f}"
+                    ]
+                    writer.writerow(row)
+                    # flush per test so finished results survive an aborted run
+                    csvfile.flush()
 
     print("Test finishes. Output to test_results.csv")
 